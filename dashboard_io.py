@@ -0,0 +1,231 @@
+"""Disk and network I/O behind maps_dashboard.py: release downloads, file stats and results tables.
+
+Kept free of Streamlit so it can be imported (and tested) without running the page.
+"""
+import hashlib
+import os
+import time
+from pathlib import Path
+from stat import S_ISREG
+from typing import Optional, Tuple
+
+import pandas as pd
+import requests
+
+# One pooled session for every asset: the github.com -> objects.githubusercontent.com redirect
+# chain reuses its TCP/TLS connections. urllib3's pool is thread-safe, so _bootstrap workers share it.
+SESSION = requests.Session()
+
+# Stats are reused for a few seconds so one script run stats each asset once, yet a file that
+# appears or changes on disk (a finished download, a redeploy) is picked up without a restart.
+STAT_TTL = 5.0
+_STATS = {}
+
+def file_stat(p_str: str) -> Optional[Tuple[int, int]]:
+    """(st_mtime_ns, st_size) of a regular file, or None; only hits are memoized, for STAT_TTL s."""
+    now = time.monotonic()
+    hit = _STATS.get(p_str)
+    if hit is not None and now - hit[0] < STAT_TTL:
+        return hit[1]
+    try:
+        stat = os.stat(p_str)
+    except OSError:
+        return None
+    if not S_ISREG(stat.st_mode):
+        return None
+    _STATS[p_str] = (now, (stat.st_mtime_ns, stat.st_size))
+    return _STATS[p_str][1]
+
+def clear_file_stats():
+    _STATS.clear()
+
+def exists(p_str: str) -> bool:
+    return file_stat(p_str) is not None
+
+def sha256_of(path: Path):
+    """Running sha256 over an existing file, so appended chunks can keep updating it."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest
+
+def _sidecar(path: Path, suffix: str) -> Path:
+    return path.with_suffix(path.suffix + suffix)
+
+def parse_checksums(text: str) -> dict:
+    """{name: sha256} from `sha256sum` output (text or `*binary` mode); other lines are skipped."""
+    sums = {}
+    for line in text.splitlines():
+        digest, _, name = line.strip().partition(" ")
+        name = name.strip().lstrip("*")
+        if len(digest) == 64 and name:
+            sums[name] = digest.lower()
+    return sums
+
+def _stamp(path: Path, sha256: str) -> str:
+    stat = file_stat(str(path))
+    return f"{sha256} {stat[0]} {stat[1]}"
+
+def _verified(local_path: Path, sha256: str) -> bool:
+    """Whether `local_path` hashes to `sha256`.
+
+    A match is recorded in a `<file>.sha256` sidecar along with the file's mtime and size, so
+    later checks skip re-hashing a multi-MB map for as long as the stat still agrees.
+    """
+    stamp_path = _sidecar(local_path, ".sha256")
+    if stamp_path.exists() and stamp_path.read_text() == _stamp(local_path, sha256):
+        return True
+    if sha256_of(local_path).hexdigest() != sha256:
+        return False
+    stamp_path.write_text(_stamp(local_path, sha256))
+    return True
+
+def _total_size(resp: requests.Response) -> Optional[int]:
+    """Full asset size: the total in Content-Range (206/416), else a plain 200's Content-Length."""
+    total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+    if total.isdigit():
+        return int(total)
+    length = resp.headers.get("Content-Length", "")
+    if resp.status_code == 200 and length.isdigit() and not resp.headers.get("Content-Encoding"):
+        return int(length)
+    return None
+
+def _receive(resp: requests.Response, part_path: Path, etag_path: Path):
+    """Stream a 200/206 body into `part_path` (a 416 means the partial is already complete).
+
+    Returns the running sha256 of the partial file and the asset's full size, if the server gave it.
+    """
+    if resp.status_code == 416:
+        return sha256_of(part_path), _total_size(resp)
+    resp.raise_for_status()
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    if resp.headers.get("ETag"):
+        etag_path.write_text(resp.headers["ETag"])
+    elif etag_path.exists():
+        etag_path.unlink()
+    if resp.status_code == 206:
+        mode, digest = "ab", sha256_of(part_path)
+    else:
+        mode, digest = "wb", hashlib.sha256()
+    with open(part_path, mode) as f:
+        for chunk in resp.iter_content(chunk_size=1 << 20):
+            if chunk:
+                f.write(chunk)
+                digest.update(chunk)
+    return digest, _total_size(resp)
+
+def download_file(url: str, local_path: Path, sha256: Optional[str] = None) -> Path:
+    """Download `url` to `local_path` if missing or stale, resuming any interrupted .part download.
+
+    With a known `sha256` the local copy must match it, and a download that doesn't is
+    discarded. Otherwise a completed download leaves its ETag in a `<file>.etag` sidecar, and
+    the local copy is revalidated with one conditional GET: only a 200 replaces it (streamed
+    from that same response); a 304, any other status or a network error keeps it. Assets
+    fetched before ETags were recorded are trusted as-is. Raises IOError rather than writing
+    st.* messages, since it runs on worker threads.
+    """
+    local_etag_path = _sidecar(local_path, ".etag")
+    part_path = _sidecar(local_path, ".part")
+    etag_path = _sidecar(part_path, ".etag")
+
+    headers = {}
+    revalidating = False
+    if exists(str(local_path)):
+        if sha256:
+            if _verified(local_path, sha256):
+                return local_path
+        elif not local_etag_path.exists():
+            return local_path
+        else:
+            headers["If-None-Match"] = local_etag_path.read_text().strip()
+            revalidating = True
+    if not revalidating and part_path.exists() and part_path.stat().st_size:
+        headers["Range"] = f"bytes={part_path.stat().st_size}-"
+        # If the asset was re-uploaded since the partial was written, the server sends it whole
+        if etag_path.exists():
+            headers["If-Range"] = etag_path.read_text().strip()
+
+    try:
+        with SESSION.get(url, headers=headers, stream=True, timeout=30) as resp:
+            if revalidating and resp.status_code != 200:
+                return local_path  # 304, or GitHub unavailable: the copy we have stays valid
+            digest, expected_size = _receive(resp, part_path, etag_path)
+
+        size = part_path.stat().st_size
+        if expected_size is not None and size != expected_size:
+            part_path.unlink()
+            raise IOError(f"size mismatch ({size} of {expected_size} bytes), will refetch")
+        if sha256 and digest.hexdigest() != sha256:
+            part_path.unlink()
+            raise IOError("sha256 mismatch, will refetch")
+        # Only a complete download ever lands at local_path, so the exists() guard stays honest
+        os.replace(part_path, local_path)
+        if etag_path.exists():
+            os.replace(etag_path, local_etag_path)
+        clear_file_stats()
+        if sha256:
+            _sidecar(local_path, ".sha256").write_text(_stamp(local_path, sha256))
+    except Exception as e:
+        if revalidating:
+            return local_path  # a failed refresh never costs us the copy on disk
+        raise IOError(f"Failed to fetch {local_path.name} from {url}: {e}") from e
+    return local_path
+
+# Optional Rust-backed xlsx reader: if not available, we fall back to openpyxl
+# (pandas' openpyxl reader already opens workbooks read_only, so that path stays lean too)
+try:
+    import python_calamine  # noqa: F401
+    HAVE_CALAMINE = tuple(int(v) for v in pd.__version__.split(".")[:2]) >= (2, 2)  # engine added in 2.2
+except Exception:
+    HAVE_CALAMINE = False
+EXCEL_ENGINE = "calamine" if HAVE_CALAMINE else "openpyxl"
+
+# Every results workbook has this layout; "P-Value" mixes text ("P<0.001") with numbers, so it stays text
+TABLE_SCHEMA = {"Parameter": "string", "Coefficient": "float64", "P-Value": "string"}
+
+def _read_xlsx(path: Path, **kwargs) -> pd.DataFrame:
+    """Read the first sheet, whatever it is named (each workbook holds a single results sheet).
+
+    `kwargs` (usecols, dtype, ...) are passed to the pandas reader.
+    """
+    return pd.read_excel(path, engine=EXCEL_ENGINE, sheet_name=0, **kwargs)
+
+def read_table_xlsx(path: Path) -> pd.DataFrame:
+    """A results workbook as the page shows it, with TABLE_SCHEMA's dtypes.
+
+    Both load_table_file and scripts/convert_xlsx.py read workbooks through here, so a
+    pre-converted Parquet copy holds exactly the frame the Excel fallback would.
+    """
+    try:
+        df = _read_xlsx(path, usecols=list(TABLE_SCHEMA), dtype=TABLE_SCHEMA)
+    except (KeyError, ValueError):
+        df = _read_xlsx(path)  # different headers: let pandas infer the columns and types
+    # Mixed text/number columns ("P<0.001" next to 0.025) can't be written to Parquet as objects
+    obj_cols = df.columns[df.dtypes == object]
+    df[obj_cols] = df[obj_cols].astype("string")
+    return df
+
+def write_parquet(df: pd.DataFrame, path: Path):
+    df.to_parquet(path, engine="pyarrow", compression="zstd")  # pyarrow ships with streamlit
+
+def load_table_file(path: Path) -> pd.DataFrame:
+    """Load a results table, going through a Parquet copy next to the .xlsx once one is up to date.
+
+    A stale or missing copy is rewritten from the workbook where the checkout is writable.
+    """
+    pq = path.with_suffix(".parquet")
+    pq_stat, xlsx_stat = file_stat(str(pq)), file_stat(str(path))
+    if pq_stat is not None and xlsx_stat is not None and pq_stat[0] >= xlsx_stat[0]:
+        return pd.read_parquet(pq, engine="pyarrow")
+    df = read_table_xlsx(path)
+    try:
+        write_parquet(df, pq)
+        clear_file_stats()  # the copy's cached stat is now out of date
+    except Exception:
+        pass  # e.g. read-only checkout: keep serving from the Excel file
+    return df
+
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    """A table's CSV download payload; the .csv copies from scripts/convert_xlsx.py are these bytes."""
+    return df.to_csv(index=False).encode("utf-8")
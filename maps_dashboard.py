@@ -1,9 +1,14 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 from pathlib import Path
-from streamlit.components.v1 import html as st_html
 import pandas as pd
 import requests
 from typing import Optional
+from urllib.parse import quote
+from dashboard_io import (
+    SESSION, clear_file_stats, csv_bytes, download_file, exists, file_stat, load_table_file, parse_checksums,
+)
 
 # =============================
 # Config
@@ -17,6 +22,8 @@ st.caption("This is an independent analysis by Isaac Tasch")
 st.caption("Contact: isaactasch.1@gmail.com")
 
 ASSETS_DIR = Path(".")
+# Served by Streamlit at /app/static/ (server.enableStaticServing in .streamlit/config.toml)
+STATIC_DIR = ASSETS_DIR / "static"
 
 # -----------------------------
 # Remote files (GitHub Releases)
@@ -27,46 +34,70 @@ TAG    = "v1Maps"  # <- your published release tag
 
 DOWNLOAD_BASE = f"https://github.com/{USER}/{REPO}/releases/download/{TAG}/"
 
-def download_file(remote_name: str, local_path: Path):
-    """Download release asset if missing locally."""
-    if local_path.exists():
-        return local_path
-    try:
-        url = DOWNLOAD_BASE + remote_name
-        st.info(f"Fetching {remote_name} from GitHub Releases…")
-        resp = requests.get(url)
-        resp.raise_for_status()
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(local_path, "wb") as f:
-            f.write(resp.content)
-        st.success(f"Downloaded {remote_name}")
-    except Exception as e:
-        st.error(f"Failed to fetch {remote_name} from {url}: {e}")
-    return local_path
-
 # -----------------------------
 # Paths
 # -----------------------------
 
-# HTML maps (large files via GitHub Releases)
-FULL_CENTER_PATH   = download_file(
-    "overlay_results_top_with_slider_dots_bottom_static.html",
-    ASSETS_DIR / "Primary Maps/overlay_results_top_with_slider_dots_bottom_static.html"
-)
-BOTTOM_LEFT_MAP_PATH  = download_file(
-    "personal_diversity_heatmap_no_water_overlap.html",
-    ASSETS_DIR / "Primary Maps/personal_diversity_heatmap_no_water_overlap.html"
-)
-BOTTOM_RIGHT_MAP_PATH = download_file(
-    "shannon_index_heatmap_no_water_overlap.html",
-    ASSETS_DIR / "Primary Maps/shannon_index_heatmap_no_water_overlap.html"
+# HTML maps (large files via GitHub Releases), downloaded under static/ so the browser loads each
+# one by URL into its iframe instead of receiving the whole document over the websocket.
+# The TAG release carries only the raw Folium exports, so the app still downloads those.
+# Switch to ".min.html" once the release also carries the output of scripts/prepare_maps.py
+# (the static server sends files as stored, so a .gz/.br export wouldn't render as a page)
+MAP_EXT = ".html"
+MAP_DIR = STATIC_DIR / "maps"
+MAP_ASSETS = tuple(
+    (name + MAP_EXT, MAP_DIR / (name + MAP_EXT))
+    for name in (
+        "overlay_results_top_with_slider_dots_bottom_static",
+        "personal_diversity_heatmap_no_water_overlap",
+        "shannon_index_heatmap_no_water_overlap",
+    )
 )
 
-# Images (safe to keep in repo)
-PERSONAL_DIVERSITY_IMG = ASSETS_DIR / "Person_diversity_example.png"
-PERSONAL_VS_ZOHRAN_IMG = ASSETS_DIR / "Personal_Diversity_vs_Proportion_Zohran.png"
-SHANNON_VS_ZOHRAN_IMG  = ASSETS_DIR / "ShannonindexvProportionZohran.png"
-QUEENS_EXAMPLE_IMG     = ASSETS_DIR / "Queens Example.png"
+# Optional `sha256sum`-style manifest published with the release (`sha256sum *.html > checksums.txt`);
+# maps listed there are verified and stored content-addressed, so an unchanged map survives a
+# TAG bump. Fetched once per process: while the release has none, that is one cached 404.
+CHECKSUMS_ASSET = "checksums.txt"
+CACHE_DIR = STATIC_DIR / "cache"
+
+@st.cache_resource(show_spinner=False)
+def get_checksums(tag: str = TAG) -> dict:
+    """{remote_name: sha256} from the release manifest, or {} if the release has none.
+
+    Any other failure raises, so that only a real answer is cached and the next run retries.
+    """
+    url = DOWNLOAD_BASE + CHECKSUMS_ASSET
+    try:
+        resp = SESSION.get(url, timeout=30)
+        if resp.status_code == 404:
+            return {}
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        raise IOError(f"Failed to fetch {CHECKSUMS_ASSET} from {url}: {e}") from e
+    return parse_checksums(resp.text)
+
+def _map_targets(tag: str = TAG) -> list:
+    """(remote_name, local_path, sha256) per map; checksummed maps live under CACHE_DIR/<sha256>/."""
+    checksums = get_checksums(tag)
+    return [
+        (remote, CACHE_DIR / checksums[remote] / remote, checksums[remote]) if remote in checksums
+        else (remote, local, None)
+        for remote, local in MAP_ASSETS
+    ]
+
+@st.cache_resource(show_spinner=False)
+def get_asset(remote_name: str, local_path_str: str, tag: str = TAG, sha256: Optional[str] = None) -> Path:
+    """Cached release asset path; `tag` is part of the key so bumping TAG refetches."""
+    return download_file(DOWNLOAD_BASE + remote_name, Path(local_path_str), sha256)
+
+# Images (safe to keep in repo): WebP copies of the PNGs from scripts/convert_figures.py.
+# st.image passes /app/static/ URLs straight to the browser, which fetches and caches each
+# figure over plain HTTP.
+PERSONAL_DIVERSITY_IMG = STATIC_DIR / "Person_diversity_example.webp"
+PERSONAL_VS_ZOHRAN_IMG = STATIC_DIR / "Personal_Diversity_vs_Proportion_Zohran.webp"
+SHANNON_VS_ZOHRAN_IMG  = STATIC_DIR / "ShannonindexvProportionZohran.webp"
+QUEENS_EXAMPLE_IMG     = STATIC_DIR / "Queens Example.webp"
+FIGURES = (PERSONAL_DIVERSITY_IMG, PERSONAL_VS_ZOHRAN_IMG, SHANNON_VS_ZOHRAN_IMG, QUEENS_EXAMPLE_IMG)
 
 # Excel files
 LOGIT_FULL_XLSX       = ASSETS_DIR / "LogitFull.xlsx"
@@ -74,6 +105,7 @@ LOGIT_PARTIAL_XLSX    = ASSETS_DIR / "LogitPartial.xlsx"
 LOGIT_BIVAR_XLSX      = ASSETS_DIR / "LogitBivariate.xlsx"
 MULTI_UNWEIGHTED_XLSX = ASSETS_DIR / "Multinomial Unweighted.xlsx"
 MULTI_WEIGHT_XLSX     = ASSETS_DIR / "Multinomial Weighted.xlsx"
+TABLE_FILES = (LOGIT_FULL_XLSX, LOGIT_PARTIAL_XLSX, LOGIT_BIVAR_XLSX, MULTI_UNWEIGHTED_XLSX, MULTI_WEIGHT_XLSX)
 
 # Heights
 DEFAULT_FULL_HEIGHT = 600
@@ -82,66 +114,180 @@ DEFAULT_PAIR_HEIGHT = 600
 # =============================
 # CSS tweaks (kept minimal; no note-box styling used)
 # =============================
-st.markdown(
-    """
-    <style>
-      [data-testid="stAppViewContainer"] .main .block-container {
-        max-width: 100% !important;
-        padding-left: 6px; padding-right: 6px;
-      }
-      div[data-testid="stIFrame"] { width: 100% !important; }
-      div[data-testid="stIFrame"] > iframe { width: 100% !important; }
-      iframe { max-width: 100% !important; }
-      body { overflow-x: hidden; }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# Built once at import; Streamlit re-emits every element on each rerun, so this stays one small message.
+# Inline rather than a <link> to /app/static/app.css: that tag would be re-sent each rerun too,
+# so it would save only these few hundred bytes and cost an extra request on first paint.
+APP_CSS = """<style>
+[data-testid="stAppViewContainer"] .main .block-container { max-width: 100% !important; padding-left: 6px; padding-right: 6px; }
+body { overflow-x: hidden; }
+</style>"""
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # =============================
-# Helpers (HTML minification + immediate render)
+# Helpers (asset probes + map embedding)
 # =============================
 
-# Optional minifier: if not available, we skip minification gracefully
-try:
-    import htmlmin
-    HAVE_HTMLMIN = True
-except Exception:
-    HAVE_HTMLMIN = False
+def _asset_mtime(path: Path) -> Optional[int]:
+    """st_mtime_ns of an asset (None if missing), from the same short-lived cache as the maps."""
+    stat = file_stat(str(path))
+    return stat[0] if stat is not None else None
+
+def render_map(path: Path, height: int):
+    """Embed a downloaded map by its /app/static/ URL, at the column's width.
+
+    Only the iframe tag crosses the websocket; the browser fetches (and HTTP-caches) the document.
+    The file's mtime rides along as ?v=, so a rerun (e.g. a height change) keeps the cached copy
+    while a re-downloaded map gets a new URL and is fetched fresh.
+    """
+    stat = file_stat(str(path))
+    if stat is None:
+        st.error(f"File not found: {path}")
+        return
+    st.iframe(f"{static_url(path)}?v={stat[0]}", height=height)
+
+def static_url(path: Path) -> str:
+    """URL Streamlit's static file server answers for a file under STATIC_DIR."""
+    return "/app/static/" + quote(path.relative_to(STATIC_DIR).as_posix())
+
+# A widget inside a fragment reruns only that fragment, so resizing or loading one map (or
+# downloading one table) doesn't re-execute the rest of the page
+@st.fragment
+def overlay_map_section(path: Path):
+    """Full-width map with its own height control."""
+    full_h = st.slider("Full-width map height (px)", 400, 1600, DEFAULT_FULL_HEIGHT, 10, key="full_h")
+    render_map(path, height=full_h)
+
+@st.fragment
+def heatmap_section(path: Path, key: str):
+    """Heatmap behind a load checkbox, with its height control shown once loaded."""
+    # Collapsed st.expander/st.tabs bodies still run and ship their maps, so gate each call itself
+    if st.checkbox("Load interactive map", value=False, key=f"show_{key}_map"):
+        pair_h = st.slider("Map height (px)", 300, 1400, DEFAULT_PAIR_HEIGHT, 10, key=f"{key}_h")
+        render_map(path, height=pair_h)
 
 @st.cache_data(show_spinner=False)
-def load_html_text(p: Path, do_minify: bool = True) -> str:
-    """Read HTML text; optionally minify large Folium exports to trim payload."""
-    txt = p.read_text(encoding="utf-8")
-    if do_minify and HAVE_HTMLMIN and len(txt) > 200_000:
-        txt = htmlmin.minify(
-            txt,
-            remove_comments=True,
-            reduce_empty_attributes=True,
-            remove_optional_attribute_quotes=False,
-            remove_empty_space=True,
-        )
-    return txt
+def load_table(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """Cached load_table_file (the Parquet copy when current, else the workbook).
+
+    `mtime_ns` is only part of the cache key: passing the workbook's current st_mtime_ns means an
+    edited .xlsx is re-read instead of served from the cache.
+    """
+    return load_table_file(Path(path_str))
 
-def render_html_now(path: Path, height: int, width_px: Optional[int] = None, minify: bool = True):
-    """Inject (possibly minified) HTML into an iframe immediately."""
-    if not path.exists():
+@st.cache_data(show_spinner=False)
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV payload for st.download_button, serialized once per table instead of every rerun."""
+    return csv_bytes(df)
+
+@st.cache_data(show_spinner=False)
+def read_bytes(path_str: str, mtime_ns: int) -> bytes:
+    """File contents (mtime_ns only keys the cache)."""
+    return Path(path_str).read_bytes()
+
+def _csv_payload(path: Path, mtime: int, df: pd.DataFrame) -> bytes:
+    """The pre-exported `<name>.csv` (scripts/convert_xlsx.py) if current, else `df` serialized."""
+    csv = path.with_suffix(".csv")
+    csv_mtime = _asset_mtime(csv)
+    if csv_mtime is not None and csv_mtime >= mtime:
+        return read_bytes(str(csv), csv_mtime)
+    return df_to_csv_bytes(df)
+
+@st.fragment
+def render_xlsx_table(path: Path, button_label: str, file_name: str, show: bool):
+    """Show a results table with a CSV download button in an expander (a download click reruns
+    just this table).
+
+    Renders nothing unless `show` (the sidebar's "Show regression tables" box) is set. `show` is
+    an argument rather than read from the sidebar global, so a fragment rerun uses the value its
+    full run rendered with.
+    """
+    if not show:
+        return
+    mtime = _asset_mtime(path)
+    if mtime is None:
         st.error(f"File not found: {path}")
         return
-    st_html(load_html_text(path, do_minify=minify), height=height, width=width_px, scrolling=False)
+    try:
+        df = load_table(str(path), mtime)
+    except Exception as e:
+        st.error(f"Failed to load Excel file: {path}\n\n{e}")
+        return
+    # Open once the reader has asked for the tables; collapsing one tucks it away again
+    with st.expander("Show table", expanded=True):
+        # A handful of rows with no sorting/scrolling needed: static HTML, not the interactive grid
+        st.table(df)
+        st.download_button(
+            button_label,
+            data=_csv_payload(path, mtime, df),
+            file_name=file_name,
+            mime="text/csv",
+        )
+
+# =============================
+# Startup (downloads on a small pool, cache warming on the script thread)
+# =============================
+MapPaths = namedtuple("MapPaths", ["full_center", "bottom_left", "bottom_right"])
+
+# The downloads are few and network-bound; more threads would only open more connections to GitHub
+DOWNLOAD_WORKERS = 4
+
+def _warm(loader, *args):
+    """Fill a loader's cache ahead of the page; a failure resurfaces where the asset is rendered."""
+    try:
+        loader(*args)
+    except Exception:
+        pass
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap(tag: str = TAG) -> MapPaths:
+    """Download the maps on a small pool and warm the table cache, once per process.
+
+    Only get_asset runs on worker threads. The tables (local disk) are loaded on the script
+    thread while the maps download, so the first page run finds them cached.
+    """
+    with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(MAP_ASSETS))) as ex:
+        maps = [ex.submit(get_asset, remote, str(local), tag, sha256)
+                for remote, local, sha256 in _map_targets(tag)]
+        for p in TABLE_FILES:
+            mtime = _asset_mtime(p)
+            if mtime is not None:
+                _warm(load_table, str(p), mtime)
+        return MapPaths(*(f.result() for f in maps))
+
+def _load_maps() -> MapPaths:
+    """_bootstrap(), inside one status container while any map still has to be downloaded."""
+    if all(exists(str(local)) for _, local, _ in _map_targets()):
+        return _bootstrap()
+    with st.status("Fetching map assets from GitHub Releases…", expanded=False) as status:
+        paths = _bootstrap()
+        status.update(label="Assets ready", state="complete")
+    return paths
+
+# A failed fetch raises out of _bootstrap, so it is not cached and the next rerun retries
+try:
+    FULL_CENTER_PATH, BOTTOM_LEFT_MAP_PATH, BOTTOM_RIGHT_MAP_PATH = _load_maps()
+except Exception as e:
+    st.error(str(e))
+    try:
+        _targets = _map_targets()
+    except IOError:  # the manifest itself is unreachable this run
+        _targets = [(remote, local, None) for remote, local in MAP_ASSETS]
+    FULL_CENTER_PATH, BOTTOM_LEFT_MAP_PATH, BOTTOM_RIGHT_MAP_PATH = (local for _, local, _ in _targets)
 
 # =============================
 # Sidebar controls
 # =============================
 st.sidebar.header("Display Settings")
-full_h = st.sidebar.slider("Full-width map height (px)", 400, 1600, DEFAULT_FULL_HEIGHT, 10)
-pair_h = st.sidebar.slider("Bottom pair height (px)", 300, 1400, DEFAULT_PAIR_HEIGHT, 10)
+# Off by default: casual readers get the prose and model statistics without the five tables
+# (the bootstrap has already cached them, so ticking this doesn't re-read any workbook)
+SHOW_TABLES = st.sidebar.checkbox("Show regression tables", value=False)
 if st.sidebar.button("🔄 Refresh maps"):
-    load_html_text.clear()
+    clear_file_stats()
 
 # =============================
 # Page
 # =============================
+
 st.markdown(
     "<h1 style='text-align: center;'>How did diversity affect the recent New York City Democratic Mayoral Primary? Some lessons from the data.</h1>",
     unsafe_allow_html=True
@@ -167,7 +313,7 @@ Below is a map of New York public housing tracts and electoral districts, along
 # FULL-WIDTH (overlay map) — LOAD IMMEDIATELY
 # -----------------------------
 st.subheader("Overlay Results")
-render_html_now(FULL_CENTER_PATH, height=full_h, width_px=2200, minify=True)
+overlay_map_section(FULL_CENTER_PATH)
 
 st.markdown(
     """
@@ -180,17 +326,21 @@ The racial category counts of each election district were then summed by countin
 st.markdown("---")
 
 # -----------------------------
-# BOTTOM ROW: two maps, side-by-side — LOAD BOTH IMMEDIATELY
+# BOTTOM ROW: two maps, side-by-side — LOADED ON REQUEST
 # -----------------------------
 st.subheader("Diversity Heatmaps")
 col1, col2 = st.columns(2, gap="large")
 
 with col1:
     st.markdown("##### Personal Diversity Heatmap")
-    render_html_now(BOTTOM_LEFT_MAP_PATH, height=pair_h, width_px=1200, minify=True)
+    heatmap_section(BOTTOM_LEFT_MAP_PATH, "personal")
 
-    if PERSONAL_DIVERSITY_IMG.exists():
-        st.image(str(PERSONAL_DIVERSITY_IMG), use_container_width=True)
+    if exists(str(PERSONAL_DIVERSITY_IMG)):
+        st.image(
+            static_url(PERSONAL_DIVERSITY_IMG),
+            width="stretch",
+            alt="Street map with one voter's dot joined by dotted lines to the neighbours of other races inside a circle around it",
+        )
     else:
         st.error(f"Image not found: {PERSONAL_DIVERSITY_IMG}")
 
@@ -202,21 +352,19 @@ To determine the Personal Diversity Index, dots were taken from the Overlay Resu
 
 with col2:
     st.markdown("##### Shannon Index Heatmap")
-    render_html_now(BOTTOM_RIGHT_MAP_PATH, height=pair_h, width_px=1200, minify=True)
+    heatmap_section(BOTTOM_RIGHT_MAP_PATH, "shannon")
 
     st.markdown(
-        """
+        r"""
 To determine the Shannon Diversity Index, proportions of each racial category were found by counting
 the number of dots that were placed in each election district by the simulation of block-level racial data.
 The relative proportions of each racial category within each election district were then determined and
 applied to the Shannon-Diversity Index formula, a standard measure of categorical diversity within a geographic subset:
-"""
-    )
 
-    st.latex(r"H' = -\sum_{i=1}^{S} p_i \ln(p_i)")
+$$
+H' = -\sum_{i=1}^{S} p_i \ln(p_i)
+$$
 
-    st.markdown(
-        """
 Where $p_i$ is equal to the proportion of each racial category present in a given election district.  
 Note that there is no control for evenness such that election districts with a higher number of distinct
 racial categories will have a higher Shannon-Diversity Index than those with fewer racial categories
@@ -234,14 +382,22 @@ district with four racial categories where $p_1 = p_2 = p_3 = p_4 = 0.25$.
 img_col1, img_col2 = st.columns(2, gap="large")
 
 with img_col1:
-    if PERSONAL_VS_ZOHRAN_IMG.exists():
-        st.image(str(PERSONAL_VS_ZOHRAN_IMG), use_container_width=True)
+    if exists(str(PERSONAL_VS_ZOHRAN_IMG)):
+        st.image(
+            static_url(PERSONAL_VS_ZOHRAN_IMG),
+            width="stretch",
+            alt="Scatter plot of personal diversity score against the proportion that voted for Mamdani, with public housing districts highlighted and a trend line",
+        )
     else:
         st.error(f"Image not found: {PERSONAL_VS_ZOHRAN_IMG}")
 
 with img_col2:
-    if SHANNON_VS_ZOHRAN_IMG.exists():
-        st.image(str(SHANNON_VS_ZOHRAN_IMG), use_container_width=True)
+    if exists(str(SHANNON_VS_ZOHRAN_IMG)):
+        st.image(
+            static_url(SHANNON_VS_ZOHRAN_IMG),
+            width="stretch",
+            alt="Scatter plot of the Shannon index against the proportion that voted for Mamdani, with public housing districts highlighted and a trend line",
+        )
     else:
         st.error(f"Image not found: {SHANNON_VS_ZOHRAN_IMG}")
 
@@ -317,78 +473,38 @@ We then fit a multinomial logit with Cuomo as baseline: (1) unweighted by voters
 # -----------------------------
 # TABLES
 # -----------------------------
+if not SHOW_TABLES:
+    st.caption("Tables hidden. Tick “Show regression tables” in the sidebar to view and download them.")
 st.markdown("### Regression Results (Logit – Full Specification), Number of Observations: 3971, Pseudo R-Squared: 0.045")
-if LOGIT_FULL_XLSX.exists():
-    try:
-        df_logit = pd.read_excel(LOGIT_FULL_XLSX, engine="openpyxl", sheet_name="Sheet1")
-        st.dataframe(df_logit, use_container_width=True)
-        st.download_button(
-            "Download table as CSV",
-            data=df_logit.to_csv(index=False).encode("utf-8"),
-            file_name="LogitFull_table.csv",
-            mime="text/csv",
-        )
-    except Exception as e:
-        st.error(f"Failed to load Excel file: {LOGIT_FULL_XLSX}\n\n{e}")
-else:
-    st.error(f"File not found: {LOGIT_FULL_XLSX}")
+render_xlsx_table(LOGIT_FULL_XLSX, "Download table as CSV", "LogitFull_table.csv", SHOW_TABLES)
 
 st.markdown("### Regression Results (Logit – Partial Specification), Number of Observations: 3971, Pseudo R-Squared: 0.03688")
-if LOGIT_PARTIAL_XLSX.exists():
-    try:
-        df_logit_partial = pd.read_excel(LOGIT_PARTIAL_XLSX, engine="openpyxl", sheet_name="Sheet1")
-        st.dataframe(df_logit_partial, use_container_width=True)
-        st.download_button(
-            "Download partial table as CSV",
-            data=df_logit_partial.to_csv(index=False).encode("utf-8"),
-            file_name="LogitPartial_table.csv",
-            mime="text/csv",
-        )
-    except Exception as e:
-        st.error(f"Failed to load Excel file: {LOGIT_PARTIAL_XLSX}\n\n{e}")
-else:
-    st.error(f"File not found: {LOGIT_PARTIAL_XLSX}")
+render_xlsx_table(LOGIT_PARTIAL_XLSX, "Download partial table as CSV", "LogitPartial_table.csv", SHOW_TABLES)
 
 st.markdown("### Regression Results (Logit – Bivariate Specification), Number of Observations: 3971, Pseudo R-Squared: 0.03036")
-if LOGIT_BIVAR_XLSX.exists():
-    try:
-        try:
-            df_logit_bivar = pd.read_excel(LOGIT_BIVAR_XLSX, engine="openpyxl", sheet_name="Sheet1")
-        except Exception:
-            try:
-                df_logit_bivar = pd.read_excel(LOGIT_BIVAR_XLSX, engine="openpyxl", sheet_name="sheet 1")
-            except Exception:
-                df_logit_bivar = pd.read_excel(LOGIT_BIVAR_XLSX, engine="openpyxl")  # first sheet
-        st.dataframe(df_logit_bivar, use_container_width=True)
-        st.download_button(
-            "Download bivariate table as CSV",
-            data=df_logit_bivar.to_csv(index=False).encode("utf-8"),
-            file_name="LogitBivariate_table.csv",
-            mime="text/csv",
-        )
-    except Exception as e:
-        st.error(f"Failed to load Excel file: {LOGIT_BIVAR_XLSX}\n\n{e}")
-else:
-    st.error(f"File not found: {LOGIT_BIVAR_XLSX}")
+render_xlsx_table(LOGIT_BIVAR_XLSX, "Download bivariate table as CSV", "LogitBivariate_table.csv", SHOW_TABLES)
 
+# $$...$$ renders display math like st.latex, so each explanation is one element with its formulas
 st.markdown(
-    """
+    r"""
 This first set of logit models estimate the regression as follows:  
-The coefficient $\\beta_j$ represents the change in log-odds of supporting Zohran for a 1-unit increase in $x_j$, holding all else constant.  
+The coefficient $\beta_j$ represents the change in log-odds of supporting Zohran for a 1-unit increase in $x_j$, holding all else constant.  
 Where,
-"""
-)
-st.latex(r"\beta_j = \frac{\partial}{\partial x_j} \log\!\left(\frac{\mu}{1 - \mu}\right)")
-st.latex(r"\mu_i = \Pr(Y_i = 1 \mid X_i) = \frac{e^{X_i \beta}}{1 + e^{X_i \beta}}")
 
-st.markdown(
-    """
+$$
+\beta_j = \frac{\partial}{\partial x_j} \log\!\left(\frac{\mu}{1 - \mu}\right)
+$$
+
+$$
+\mu_i = \Pr(Y_i = 1 \mid X_i) = \frac{e^{X_i \beta}}{1 + e^{X_i \beta}}
+$$
+
 Since the logit model estimates diminishing effects at the extremes, at a moderate diversity level (personal diversity score ≈ **0.5**), a **1%** increase in average personal diversity score is associated with an approximate increase in Mamdani’s vote share of:
-"""
-)
-st.latex(r"\frac{\partial \mu}{\partial \text{PDS}} = \beta \cdot \mu \cdot (1 - \mu) = 2.5687 \cdot 0.5 \cdot 0.5 = 0.642")
-st.markdown(
-    """
+
+$$
+\frac{\partial \mu}{\partial \text{PDS}} = \beta \cdot \mu \cdot (1 - \mu) = 2.5687 \cdot 0.5 \cdot 0.5 = 0.642
+$$
+
 Thus the elasticity (around 0.5) is **0.00642/0.5 = 0.0138** (≈ **1.4%**).  
 """
 )
@@ -397,99 +513,65 @@ Thus the elasticity (around 0.5) is **0.00642/0.5 = 0.0138** (≈ **1.4%**).
 # Multinomial
 # -----------------------------
 st.markdown("### Regression Results (Multinomial Logit — Unweighted), Number of Observations: 3971, Pseudo R-Squared: 0.26, Within-sample accuracy: 0.744")
-if MULTI_UNWEIGHTED_XLSX.exists():
-    try:
-        try:
-            df_multi_unw = pd.read_excel(MULTI_UNWEIGHTED_XLSX, engine="openpyxl", sheet_name="Sheet1")
-        except Exception:
-            try:
-                df_multi_unw = pd.read_excel(MULTI_UNWEIGHTED_XLSX, engine="openpyxl", sheet_name="sheet 1")
-            except Exception:
-                df_multi_unw = pd.read_excel(MULTI_UNWEIGHTED_XLSX, engine="openpyxl")  # first sheet
-        st.dataframe(df_multi_unw, use_container_width=True)
-        st.download_button(
-            "Download multinomial table as CSV",
-            data=df_multi_unw.to_csv(index=False).encode("utf-8"),
-            file_name="Multinomial_Unweighted_table.csv",
-            mime="text/csv",
-        )
-    except Exception as e:
-        st.error(f"Failed to load Excel file: {MULTI_UNWEIGHTED_XLSX}\n\n{e}")
-else:
-    st.error(f"File not found: {MULTI_UNWEIGHTED_XLSX}")
+render_xlsx_table(MULTI_UNWEIGHTED_XLSX, "Download multinomial table as CSV", "Multinomial_Unweighted_table.csv", SHOW_TABLES)
 
 st.markdown("---")
-st.markdown("### Interpretation of Multinomial Logit Results")
+INTERPRETATION_MD = r"""
+### Interpretation of Multinomial Logit Results
 
-st.markdown(
-    """
 The multinomial logit model is motivated by a latent utility function determining individual candidate choice,
-"""
-)
-st.latex(r"U_{ij} = x_i^\top \beta_j + \varepsilon_{ij}")
-st.markdown(
-    """
+
+$$
+U_{ij} = x_i^\top \beta_j + \varepsilon_{ij}
+$$
+
 with Cuomo as the baseline. We estimate
-"""
-)
-st.latex(r"P(Y_i = j \mid x_i) = \frac{\exp(x_i^\top \beta_j)}{\sum_{m=1}^J \exp(x_i^\top \beta_m)}")
-st.markdown("We normalize $\\beta_J = 0$, so")
-st.latex(r"p_{ij} = \frac{\exp(x_i^\top \beta_j)}{1 + \sum_{m=1}^{J-1} \exp(x_i^\top \beta_m)}, \quad j = 1, \dots, J-1.")
-st.markdown("And in log-odds form:")
-st.latex(r"\ln \!\left( \frac{P(Y_i = j)}{P(Y_i = J)} \right) = x_i^\top \beta_j.")
 
-st.markdown(
-    """
-For the *personal diversity score* coefficient $\\beta = 7.7009$, a 1% increase in average personal diversity score yields
-"""
-)
-st.latex(r"e^{7.7 \times 0.01} \approx 1.08")
-st.markdown("≈ **8%** higher odds of Mamdani over Cuomo.")
+$$
+P(Y_i = j \mid x_i) = \frac{\exp(x_i^\top \beta_j)}{\sum_{m=1}^J \exp(x_i^\top \beta_m)}
+$$
 
-st.markdown("- If $P=0.20$ then $\\Delta p \\approx 0.20 \\cdot 0.80 \\cdot 7.7 \\cdot 0.01 = 0.0123$ (≈ **+1.2 points**).")
-st.markdown("- If $P=0.50$ then $\\Delta p \\approx 0.50 \\cdot 0.50 \\cdot 7.7 \\cdot 0.01 = 0.019$ (≈ **+1.9 points**).")
-st.markdown("- If $P=0.80$ then $\\Delta p \\approx 0.80 \\cdot 0.20 \\cdot 7.7 \\cdot 0.01 = 0.0123$ (≈ **+1.2 points**).")
+We normalize $\beta_J = 0$, so
+
+$$
+p_{ij} = \frac{\exp(x_i^\top \beta_j)}{1 + \sum_{m=1}^{J-1} \exp(x_i^\top \beta_m)}, \quad j = 1, \dots, J-1.
+$$
+
+And in log-odds form:
+
+$$
+\ln \!\left( \frac{P(Y_i = j)}{P(Y_i = J)} \right) = x_i^\top \beta_j.
+$$
+
+For the *personal diversity score* coefficient $\beta = 7.7009$, a 1% increase in average personal diversity score yields
+
+$$
+e^{7.7 \times 0.01} \approx 1.08
+$$
+
+≈ **8%** higher odds of Mamdani over Cuomo.
+
+- If $P=0.20$ then $\Delta p \approx 0.20 \cdot 0.80 \cdot 7.7 \cdot 0.01 = 0.0123$ (≈ **+1.2 points**).
+- If $P=0.50$ then $\Delta p \approx 0.50 \cdot 0.50 \cdot 7.7 \cdot 0.01 = 0.019$ (≈ **+1.9 points**).
+- If $P=0.80$ then $\Delta p \approx 0.80 \cdot 0.20 \cdot 7.7 \cdot 0.01 = 0.0123$ (≈ **+1.2 points**).
 
-st.markdown(
-    """
 On average, that’s about a **1.3 percentage point** increase per +1% in diversity, largest in the mid range of probabilities.
-"""
-)
-st.write(
-    "Elasticity at the midpoint (50/50):"
-)
-st.latex(r"(1 - 0.5)\cdot 7.7009 \cdot 0.5 \approx 1.93\%")
 
-st.markdown(
-    """
+Elasticity at the midpoint (50/50):
+
+$$
+(1 - 0.5)\cdot 7.7009 \cdot 0.5 \approx 1.93\%
+$$
+
 Thus the elasticity is, **51.93 / 50 = 1.0386** or roughly 4% at the midpoint. This means that for an election district with a personal diversity score of around 50%, if that election district's personal diversity score increases by .01 or 1%, there will be an increase in the liklihood that Zohran Mamdani wins that election district by just under 4%, holding all other measured variables constant. The predicted leverage of effect of diversity on Mamdani's electorate outcomes are therefore quite large.  
 """
-)
+st.markdown(INTERPRETATION_MD)
 
 # -----------------------------
 # MULTINOMIAL WEIGHTED TABLE
 # -----------------------------
 st.markdown("### Regression Results (Multinomial Logit — Weighted), Number of Observations: 348,281, Pseudo R-Squared: 0.2919, Within-sample accuracy: 0.770")
-if MULTI_WEIGHT_XLSX.exists():
-    try:
-        try:
-            df_multi_weight = pd.read_excel(MULTI_WEIGHT_XLSX, engine="openpyxl", sheet_name="Sheet1")
-        except Exception:
-            try:
-                df_multi_weight = pd.read_excel(MULTI_WEIGHT_XLSX, engine="openpyxl", sheet_name="sheet 1")
-            except Exception:
-                df_multi_weight = pd.read_excel(MULTI_WEIGHT_XLSX, engine="openpyxl")  # fallback to first sheet
-        st.dataframe(df_multi_weight, use_container_width=True)
-        st.download_button(
-            "Download multinomial weighted table as CSV",
-            data=df_multi_weight.to_csv(index=False).encode("utf-8"),
-            file_name="MultinomialWeighted_table.csv",
-            mime="text/csv",
-        )
-    except Exception as e:
-        st.error(f"Failed to load Excel file: {MULTI_WEIGHT_XLSX}\n\n{e}")
-else:
-    st.error(f"File not found: {MULTI_WEIGHT_XLSX}")
+render_xlsx_table(MULTI_WEIGHT_XLSX, "Download multinomial weighted table as CSV", "MultinomialWeighted_table.csv", SHOW_TABLES)
 
 st.markdown(
     r"""
@@ -499,18 +581,13 @@ Observations were duplicated according to vote counts (avg duplication ≈ 87.7)
 Notably, both pseudo $R^2$ and in-sample accuracy increased with weighting — evidence that average personal diversity score, turnout, % multi-lingual, and % non-native are important determinants of district-level outcomes.
 
 Weighted accuracy is:
-"""
-)
-st.latex(
-    r"""
-    \text{Weighted Accuracy} 
-    = \frac{\sum_{\text{ED}} \text{Total}_{ED} \cdot 1\{\text{predicted winner} = \text{actual winner}\}}
-           {\sum_{\text{ED}} \text{Total}_{ED}}
-    """
-)
 
-st.markdown(
-    """
+$$
+\text{Weighted Accuracy}
+= \frac{\sum_{\text{ED}} \text{Total}_{ED} \cdot 1\{\text{predicted winner} = \text{actual winner}\}}
+       {\sum_{\text{ED}} \text{Total}_{ED}}
+$$
+
 This implies the model performs better as district vote size grows.  
 Insofar as votes for Zohran Mamdani represent votes for socialist political sentiment, the results suggest that racial, ethnic, and cultural diversity is associated with greater sympathy for socialist policies. Conversely, homogeneity is associated with lower sympathy.
 """
@@ -522,11 +599,12 @@ st.markdown("""
 The key takeaway from these results is that racial diversity has a non-negligible effect on the likelihood that a voting population will favor socialist politics. What is extremely curious about these findings however is the ‘strangeness’ of populations within public housing districts, that tend to have high personal diversity scores and Shannon indices and were yet more likely to vote for Cuomo. Take for example this image of West-Queens below.
 """)
 
-if QUEENS_EXAMPLE_IMG.exists():
+if exists(str(QUEENS_EXAMPLE_IMG)):
     st.image(
-        str(QUEENS_EXAMPLE_IMG),
+        static_url(QUEENS_EXAMPLE_IMG),
         caption="West-Queens Example: Diversity and Voting Patterns",
-        use_container_width=True,
+        width="stretch",
+        alt="Map of West Queens with election districts shaded by winning candidate and race dot density; most districts lean Mamdani, while the outlined public housing areas lean Cuomo",
     )
 else:
     st.error(f"Image not found: {QUEENS_EXAMPLE_IMG}. Make sure this file is in your repo at that path.")
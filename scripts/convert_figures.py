@@ -0,0 +1,39 @@
+"""Convert the PNG figures to the WebP copies the page shows, under static/.
+
+Streamlit serves `static/` at /app/static/ (server.enableStaticServing in .streamlit/config.toml)
+and st.image hands such URLs to the browser untouched, so each figure is a separate, cacheable
+HTTP download instead of being decoded and re-encoded (local WebP files come out as PNG) on
+every run. Re-run after replacing a figure, from anywhere:
+
+    python scripts/convert_figures.py
+"""
+from pathlib import Path
+
+from PIL import Image
+
+ROOT = Path(__file__).resolve().parent.parent
+STATIC_DIR = ROOT / "static"
+FIGURES = (
+    "Person_diversity_example.png",
+    "Personal_Diversity_vs_Proportion_Zohran.png",
+    "ShannonindexvProportionZohran.png",
+    "Queens Example.png",
+)
+MAX_WIDTH = 1400  # the sources are up to 3000 px wide but never shown wider than a page column
+
+
+def convert(path: Path) -> Path:
+    """Write `path` downscaled to MAX_WIDTH as `static/<name>.webp`."""
+    out = STATIC_DIR / path.with_suffix(".webp").name
+    with Image.open(path) as im:
+        im.thumbnail((MAX_WIDTH, MAX_WIDTH * 4))
+        STATIC_DIR.mkdir(exist_ok=True)
+        im.save(out, "WEBP", quality=85, method=6)
+    return out
+
+
+if __name__ == "__main__":
+    for name in FIGURES:
+        src = ROOT / name
+        out = convert(src)
+        print(f"wrote {out.relative_to(ROOT)} ({src.stat().st_size // 1024} KB -> {out.stat().st_size // 1024} KB)")
@@ -0,0 +1,38 @@
+"""Pre-convert the regression result workbooks to Parquet (for display) and CSV (for download).
+
+maps_dashboard.load_table reads `<name>.parquet` next to each `<name>.xlsx` whenever it is
+at least as new as the workbook, and the download buttons serve `<name>.csv` under the same
+rule, so running this after editing a table keeps cold starts off the Excel parser and
+reruns off the CSV writer entirely. Run from anywhere:
+
+    python scripts/convert_xlsx.py
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dashboard_io import csv_bytes, read_table_xlsx, write_parquet  # noqa: E402
+TABLES = (
+    "LogitFull.xlsx",
+    "LogitPartial.xlsx",
+    "LogitBivariate.xlsx",
+    "Multinomial Unweighted.xlsx",
+    "Multinomial Weighted.xlsx",
+)
+
+
+def convert(path: Path) -> Path:
+    """Write `path` (first sheet) next to itself as Parquet and CSV, through the page's own reader."""
+    df = read_table_xlsx(path)
+    out = path.with_suffix(".parquet")
+    write_parquet(df, out)
+    path.with_suffix(".csv").write_bytes(csv_bytes(df))
+    return out
+
+
+if __name__ == "__main__":
+    for name in TABLES:
+        out = convert(ROOT / name).relative_to(ROOT)
+        print(f"wrote {out} and {out.with_suffix('.csv')}")
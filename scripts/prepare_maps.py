@@ -0,0 +1,75 @@
+"""Prepare the Folium map exports for upload to the GitHub release.
+
+Each export is minified once here to `<name>.min.html`, so the app never minifies at runtime.
+Upload the outputs to the release and set MAP_EXT = ".min.html" in maps_dashboard.py. The app
+iframes the maps from Streamlit's static server, which sends files as stored, so it can only
+use this plain output. --gzip (`<name>.min.html.gz`) and --brotli (`<name>.min.html.br`) write
+compressed copies instead, for hosting that serves them with a Content-Encoding.
+
+    python scripts/prepare_maps.py static/maps/*.html
+    python scripts/prepare_maps.py --htmlmin static/maps/*.html   # full tokenizer, slower
+    python scripts/prepare_maps.py --gzip static/maps/*.html
+    python scripts/prepare_maps.py --brotli static/maps/*.html    # needs `pip install brotli`
+"""
+import argparse
+import gzip
+import re
+from pathlib import Path
+from typing import Optional
+
+# Single-pass equivalents of the htmlmin options we used (remove_comments, remove_empty_space).
+# Folium output is almost all indentation and comments, so these recover nearly all the bytes
+# without tokenizing the HTML. Like htmlmin, keep <!--! ... --> and conditional comments, and only
+# drop inter-tag whitespace that contains a newline (a lone space between inline tags matters).
+_RE_COMMENT = re.compile(rb"<!--(?!!|\[if).*?-->", re.S)
+_RE_WS = re.compile(rb">[ \t]*[\r\n]\s*<")
+
+
+def fast_minify(data: bytes) -> bytes:
+    return _RE_WS.sub(b"><", _RE_COMMENT.sub(b"", data))
+
+
+def htmlmin_minify(data: bytes) -> bytes:
+    import htmlmin
+
+    return htmlmin.minify(
+        data.decode("utf-8"),
+        remove_comments=True,
+        reduce_empty_attributes=True,
+        remove_optional_attribute_quotes=False,
+        remove_empty_space=True,
+    ).encode("utf-8")
+
+
+def prepare(src: Path, use_htmlmin: bool = False, codec: Optional[str] = None) -> Path:
+    """Minify + compress (`codec` "gzip", "br" or None) one export next to itself and return the output path."""
+    data = src.read_bytes()
+    data = htmlmin_minify(data) if use_htmlmin else fast_minify(data)
+    if codec is None:
+        out = src.with_name(src.stem + ".min.html")
+        out.write_bytes(data)
+        return out
+    if codec == "br":
+        import brotli
+
+        out = src.with_name(src.stem + ".min.html.br")
+        out.write_bytes(brotli.compress(data, quality=11, mode=brotli.MODE_TEXT))
+        return out
+    out = src.with_name(src.stem + ".min.html.gz")
+    # mtime=0 keeps the archive byte-identical across runs, so re-uploads don't churn ETags
+    out.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("exports", nargs="+", type=Path, help="Folium .html exports")
+    parser.add_argument("--htmlmin", action="store_true", help="minify with htmlmin instead of the regex pass")
+    codecs = parser.add_mutually_exclusive_group()
+    codecs.add_argument("--gzip", action="store_true", help="write <name>.min.html.gz instead")
+    codecs.add_argument("--brotli", action="store_true", help="write <name>.min.html.br instead")
+    args = parser.parse_args()
+    codec = "br" if args.brotli else "gzip" if args.gzip else None
+    for src in args.exports:
+        out = prepare(src, use_htmlmin=args.htmlmin, codec=codec)
+        print(f"{src} -> {out} ({src.stat().st_size:,} -> {out.stat().st_size:,} bytes)")
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# The app modules live at the repo root and the offline tools in scripts/, neither installed
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
@@ -0,0 +1,36 @@
+import hashlib
+
+import dashboard_io
+from dashboard_io import download_file, parse_checksums
+
+A = "a" * 64
+B = "B" * 64
+
+
+def test_parses_text_and_binary_mode_lines():
+    text = f"{A}  overlay.html\n{B} *shannon.html\n"
+    assert parse_checksums(text) == {"overlay.html": A, "shannon.html": B.lower()}
+
+
+def test_keeps_spaces_in_names():
+    assert parse_checksums(f"{A}  Queens Example.png") == {"Queens Example.png": A}
+
+
+def test_skips_blank_and_malformed_lines():
+    text = f"\n# sha256sum output\nnot-a-digest  overlay.html\n{A}\n  {A}  personal.html  \n"
+    assert parse_checksums(text) == {"personal.html": A}
+
+
+def test_verified_copy_is_not_rehashed(tmp_path, monkeypatch):
+    body = b"<html></html>"
+    local = tmp_path / "map.html"
+    local.write_bytes(body)
+    sha = hashlib.sha256(body).hexdigest()
+    dashboard_io.clear_file_stats()
+    download_file("https://example.invalid/map.html", local, sha)
+    assert (tmp_path / "map.html.sha256").exists()
+
+    def boom(path):
+        raise AssertionError("re-hashed a file whose stat matches its stamp")
+    monkeypatch.setattr(dashboard_io, "sha256_of", boom)
+    assert download_file("https://example.invalid/map.html", local, sha) == local
@@ -0,0 +1,171 @@
+import hashlib
+
+import pytest
+import requests
+
+import dashboard_io
+from dashboard_io import download_file
+
+URL = "https://example.invalid/asset.html"
+BODY = b"0123456789"
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), 4):
+            yield self.body[i:i + 4]
+
+
+class FakeSession:
+    """Replays canned responses and records the headers of every request made."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        self.requests.append(dict(headers or {}))
+        resp = self.responses.pop(0)
+        if isinstance(resp, Exception):
+            raise resp
+        return resp
+
+
+@pytest.fixture
+def session(monkeypatch):
+    def install(*responses):
+        fake = FakeSession(*responses)
+        monkeypatch.setattr(dashboard_io, "SESSION", fake)
+        return fake
+    dashboard_io.clear_file_stats()
+    yield install
+    dashboard_io.clear_file_stats()
+
+
+def test_fresh_download_records_etag(tmp_path, session):
+    fake = session(FakeResponse(200, BODY, {"Content-Length": "10", "ETag": '"v1"'}))
+    local = tmp_path / "asset.html"
+    assert download_file(URL, local) == local
+    assert local.read_bytes() == BODY
+    assert (tmp_path / "asset.html.etag").read_text() == '"v1"'
+    assert not (tmp_path / "asset.html.part").exists()
+    assert fake.requests == [{}]
+
+
+def test_206_resumes_partial(tmp_path, session):
+    (tmp_path / "asset.html.part").write_bytes(BODY[:4])
+    (tmp_path / "asset.html.part.etag").write_text('"v1"')
+    fake = session(FakeResponse(206, BODY[4:], {"Content-Range": "bytes 4-9/10", "ETag": '"v1"'}))
+    local = tmp_path / "asset.html"
+    download_file(URL, local, sha256=hashlib.sha256(BODY).hexdigest())
+    assert local.read_bytes() == BODY
+    assert fake.requests == [{"Range": "bytes=4-", "If-Range": '"v1"'}]
+
+
+def test_200_on_resume_overwrites_partial(tmp_path, session):
+    (tmp_path / "asset.html.part").write_bytes(b"stale")
+    session(FakeResponse(200, BODY, {"Content-Length": "10"}))
+    local = tmp_path / "asset.html"
+    download_file(URL, local)
+    assert local.read_bytes() == BODY
+
+
+def test_416_means_partial_is_complete(tmp_path, session):
+    (tmp_path / "asset.html.part").write_bytes(BODY)
+    session(FakeResponse(416, headers={"Content-Range": "bytes */10"}))
+    local = tmp_path / "asset.html"
+    download_file(URL, local, sha256=hashlib.sha256(BODY).hexdigest())
+    assert local.read_bytes() == BODY
+
+
+def test_size_mismatch_discards_partial(tmp_path, session):
+    session(FakeResponse(200, BODY[:5], {"Content-Length": "10"}))
+    local = tmp_path / "asset.html"
+    with pytest.raises(IOError, match="size mismatch"):
+        download_file(URL, local)
+    assert not local.exists()
+    assert not (tmp_path / "asset.html.part").exists()
+
+
+def test_sha_mismatch_discards_partial(tmp_path, session):
+    session(FakeResponse(200, BODY, {"Content-Length": "10"}))
+    local = tmp_path / "asset.html"
+    with pytest.raises(IOError, match="sha256 mismatch"):
+        download_file(URL, local, sha256="0" * 64)
+    assert not local.exists()
+    assert not (tmp_path / "asset.html.part").exists()
+
+
+def test_matching_sha_skips_network(tmp_path, session):
+    local = tmp_path / "asset.html"
+    local.write_bytes(BODY)
+    fake = session()
+    download_file(URL, local, sha256=hashlib.sha256(BODY).hexdigest())
+    assert fake.requests == []
+
+
+@pytest.mark.parametrize("outcome", [
+    FakeResponse(304),
+    FakeResponse(429),
+    FakeResponse(503),
+    requests.ConnectionError("offline"),
+])
+def test_revalidation_keeps_local_copy_unless_200(tmp_path, session, outcome):
+    local = tmp_path / "asset.html"
+    local.write_bytes(b"old")
+    (tmp_path / "asset.html.etag").write_text('"v0"')
+    fake = session(outcome)
+    download_file(URL, local)
+    assert local.read_bytes() == b"old"
+    assert fake.requests == [{"If-None-Match": '"v0"'}]
+
+
+def test_revalidation_200_reuses_response_body(tmp_path, session):
+    local = tmp_path / "asset.html"
+    local.write_bytes(b"old")
+    (tmp_path / "asset.html.etag").write_text('"v0"')
+    fake = session(FakeResponse(200, BODY, {"Content-Length": "10", "ETag": '"v1"'}))
+    download_file(URL, local)
+    assert local.read_bytes() == BODY
+    assert (tmp_path / "asset.html.etag").read_text() == '"v1"'
+    assert len(fake.requests) == 1
+
+
+def test_missing_asset_raises(tmp_path, session):
+    session(FakeResponse(404))
+    with pytest.raises(IOError, match="Failed to fetch asset.html"):
+        download_file(URL, tmp_path / "asset.html")
+
+
+def test_file_stat_does_not_cache_misses(tmp_path, session):
+    path = tmp_path / "late.html"
+    assert dashboard_io.file_stat(str(path)) is None
+    path.write_bytes(BODY)
+    assert dashboard_io.file_stat(str(path))[1] == len(BODY)
+
+
+def test_file_stat_expires(tmp_path, session, monkeypatch):
+    path = tmp_path / "asset.html"
+    path.write_bytes(BODY)
+    clock = [100.0]
+    monkeypatch.setattr(dashboard_io.time, "monotonic", lambda: clock[0])
+    assert dashboard_io.file_stat(str(path))[1] == 10
+    path.write_bytes(BODY * 2)
+    assert dashboard_io.file_stat(str(path))[1] == 10
+    clock[0] += dashboard_io.STAT_TTL
+    assert dashboard_io.file_stat(str(path))[1] == 20
@@ -0,0 +1,71 @@
+import gzip
+
+import pytest
+
+from prepare_maps import fast_minify, prepare
+
+PAGE = b"""<!DOCTYPE html>
+<html>
+    <head>
+        <!-- folium boilerplate -->
+        <!--[if lt IE 9]><script src="html5shiv.js"></script><![endif]-->
+        <!--! keep: licence notice -->
+    </head>
+    <body>
+        <b>Mamdani</b> <i>Cuomo</i>
+        <!-- multi
+             line -->
+        <script>var map = L.map("map");</script>
+    </body>
+</html>
+"""
+
+
+def test_keeps_conditional_and_bang_comments():
+    out = fast_minify(PAGE)
+    assert b'<!--[if lt IE 9]><script src="html5shiv.js"></script><![endif]-->' in out
+    assert b"<!--! keep: licence notice -->" in out
+
+
+def test_drops_plain_comments():
+    out = fast_minify(PAGE)
+    assert b"folium boilerplate" not in out
+    assert b"multi" not in out
+
+
+def test_drops_only_newline_whitespace_between_tags():
+    out = fast_minify(PAGE)
+    assert b"<html><head>" in out
+    assert b"\n" not in out.split(b"<script>")[0]
+    # A lone space between inline tags is rendered, so it stays
+    assert b"<b>Mamdani</b> <i>Cuomo</i>" in out
+
+
+def test_leaves_script_text_alone():
+    assert b'<script>var map = L.map("map");</script>' in fast_minify(PAGE)
+
+
+@pytest.mark.parametrize("codec, suffix", [("gzip", ".min.html.gz"), (None, ".min.html")])
+def test_prepare_writes_minified_export(tmp_path, codec, suffix):
+    src = tmp_path / "overlay.html"
+    src.write_bytes(PAGE)
+    out = prepare(src, codec=codec)
+    assert out.name == "overlay" + suffix
+    data = out.read_bytes()
+    assert (gzip.decompress(data) if codec else data) == fast_minify(PAGE)
+
+
+def test_gzip_output_is_reproducible(tmp_path):
+    src = tmp_path / "overlay.html"
+    src.write_bytes(PAGE)
+    first = prepare(src, codec="gzip").read_bytes()
+    assert prepare(src, codec="gzip").read_bytes() == first
+
+
+def test_prepare_brotli(tmp_path):
+    brotli = pytest.importorskip("brotli")
+    src = tmp_path / "overlay.html"
+    src.write_bytes(PAGE)
+    out = prepare(src, codec="br")
+    assert out.name == "overlay.min.html.br"
+    assert brotli.decompress(out.read_bytes()) == fast_minify(PAGE)
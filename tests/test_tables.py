@@ -0,0 +1,62 @@
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import convert_xlsx
+from dashboard_io import TABLE_SCHEMA, csv_bytes, load_table_file, read_table_xlsx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WORKBOOKS = convert_xlsx.TABLES
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "LogitFull.xlsx"
+    shutil.copy(ROOT / "LogitFull.xlsx", path)
+    return path
+
+
+def _touch(path, mtime):
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize("name", WORKBOOKS)
+def test_workbooks_read_with_schema(name):
+    df = read_table_xlsx(ROOT / name)
+    assert dict(df.dtypes.astype(str)) == TABLE_SCHEMA
+
+
+@pytest.mark.parametrize("name", WORKBOOKS)
+def test_committed_copies_match_excel_fallback(name):
+    df = read_table_xlsx(ROOT / name)
+    assert pd.read_parquet((ROOT / name).with_suffix(".parquet")).equals(df)
+    assert (ROOT / name).with_suffix(".csv").read_bytes() == csv_bytes(df)
+
+
+def test_stale_copy_is_rebuilt_from_workbook(workbook):
+    pq = workbook.with_suffix(".parquet")
+    pd.DataFrame({"Parameter": ["stale"]}).to_parquet(pq)
+    _touch(pq, 1_000_000)
+    _touch(workbook, 2_000_000)
+    df = load_table_file(workbook)
+    assert df.equals(read_table_xlsx(workbook))
+    assert pd.read_parquet(pq).equals(df)
+
+
+def test_missing_copy_is_written(workbook):
+    df = load_table_file(workbook)
+    assert pd.read_parquet(workbook.with_suffix(".parquet")).equals(df)
+
+
+def test_fresh_copy_is_served_without_excel(workbook, monkeypatch):
+    convert_xlsx.convert(workbook)
+    expected = read_table_xlsx(workbook)
+
+    def no_excel(*args, **kwargs):
+        raise AssertionError("read the workbook although its Parquet copy is current")
+    monkeypatch.setattr(pd, "read_excel", no_excel)
+    assert load_table_file(workbook).equals(expected)